@@ -1,5 +1,7 @@
+import asyncio
 import logging
 
+import aiohttp
 from telegram.error import NetworkError
 from telegram.ext import (
     ApplicationBuilder,
@@ -50,24 +52,48 @@ async def log_error(update, context) -> None:
 
 
 async def on_startup(application) -> None:
+    from bot.config import get_scan_concurrency
     from bot.services.db import init_db
     from bot.services.jobs import restore_scanning_jobs, start_global_jobs
 
     # 1. Initialize SQLite Database
     init_db()
 
-    # 2. Configure Telegram UI commands
+    # 2. Open one keep-alive HTTP session shared by all async exchange calls,
+    #    and cap how many per-chat funding scans may hit the exchanges at once.
+    application.bot_data["http"] = aiohttp.ClientSession(
+        connector=aiohttp.TCPConnector(
+            limit=32,
+            limit_per_host=8,
+            keepalive_timeout=75,
+        )
+    )
+    application.bot_data["scan_sem"] = asyncio.Semaphore(get_scan_concurrency())
+
+    # 3. Configure Telegram UI commands
     await configure_bot_ui(application)
 
-    # 3. Start system-wide background jobs (e.g. hourly turnover logger)
+    # 4. Start system-wide background jobs (e.g. hourly turnover logger)
     start_global_jobs(application)
 
-    # 4. Restore per-chat alert subscriptions and their saved intervals.
+    # 5. Restore per-chat alert subscriptions and their saved intervals.
     restore_scanning_jobs(application)
 
 
+async def on_shutdown(application) -> None:
+    http = application.bot_data.pop("http", None)
+    if http is not None:
+        await http.close()
+
+
 def build_application(token: str):
-    application = ApplicationBuilder().token(token).post_init(on_startup).build()
+    application = (
+        ApplicationBuilder()
+        .token(token)
+        .post_init(on_startup)
+        .post_shutdown(on_shutdown)
+        .build()
+    )
     application.add_handler(CommandHandler("start", start))
     application.add_handler(CommandHandler("negative", negative))
     application.add_handler(CommandHandler("positive", positive))
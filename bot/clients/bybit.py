@@ -1,11 +1,16 @@
 from __future__ import annotations
 
+import threading
 import time
 from datetime import UTC, datetime
 
+import aiohttp
+import numpy as np
 import requests
 from pybit.unified_trading import HTTP
 
+from bot.clients.http import build_retrying_session, json_loads, parse_json
+from bot.config import get_funding_cache_ttl
 from bot.models import Candle, FundingRatePoint, OrderBookSnapshot
 
 
@@ -15,6 +20,37 @@ BYBIT_ORDERBOOK_URL = "https://api.bybit.com/v5/market/orderbook"
 BYBIT_FUNDING_HISTORY_URL = "https://api.bybit.com/v5/market/funding/history"
 MILLISECONDS_PER_DAY = 24 * 60 * 60 * 1000
 
+_SESSION: requests.Session | None = None
+_SESSION_LOCK = threading.Lock()
+
+_KLINE_SESSION: HTTP | None = None
+_KLINE_SESSION_LOCK = threading.Lock()
+
+# Full ticker snapshots per category, stored as (fetched_at, tickers). The
+# snapshot backs both user commands and the repeating funding scan, so a short
+# TTL deduplicates bursts without masking funding-interval updates.
+_TICKER_CACHE: dict[str, tuple[float, list[dict]]] = {}
+
+
+def _get_session() -> requests.Session:
+    """Return the shared pooled session so repeated calls reuse connections."""
+    global _SESSION
+    if _SESSION is None:
+        with _SESSION_LOCK:
+            if _SESSION is None:
+                _SESSION = build_retrying_session()
+    return _SESSION
+
+
+def _get_kline_session() -> HTTP:
+    """Return the shared pybit client so kline calls reuse its pooled session."""
+    global _KLINE_SESSION
+    if _KLINE_SESSION is None:
+        with _KLINE_SESSION_LOCK:
+            if _KLINE_SESSION is None:
+                _KLINE_SESSION = HTTP(testnet=False, recv_window=10000)
+    return _KLINE_SESSION
+
 
 def _interval_duration_ms(interval: str) -> int | None:
     if interval.isdigit():
@@ -26,24 +62,57 @@ def _interval_duration_ms(interval: str) -> int | None:
     return None
 
 
+def _cache_ticker_payload(payload: dict, category: str) -> list[dict]:
+    if payload.get("retCode") != 0:
+        print(f"[Bybit] API error while fetching tickers: {payload.get('retMsg')}")
+        return []
+
+    tickers = payload.get("result", {}).get("list", [])
+    _TICKER_CACHE[category] = (time.monotonic(), tickers)
+    return tickers
+
+
 def fetch_all_tickers(category: str = "linear") -> list[dict]:
+    cached = _TICKER_CACHE.get(category)
+    if cached is not None and time.monotonic() - cached[0] < get_funding_cache_ttl():
+        return cached[1]
+
     try:
-        response = requests.get(
+        response = _get_session().get(
             BYBIT_TICKERS_URL,
             params={"category": category, "limit": 1000},
             timeout=10,
         )
         response.raise_for_status()
-        payload = response.json()
-    except Exception as exc:
+        payload = parse_json(response)
+    except (requests.RequestException, ValueError) as exc:
         print(f"[Bybit] Error fetching tickers: {exc}")
         return []
 
-    if payload.get("retCode") != 0:
-        print(f"[Bybit] API error while fetching tickers: {payload.get('retMsg')}")
+    return _cache_ticker_payload(payload, category)
+
+
+async def fetch_all_tickers_async(
+    http: aiohttp.ClientSession,
+    category: str = "linear",
+) -> list[dict]:
+    cached = _TICKER_CACHE.get(category)
+    if cached is not None and time.monotonic() - cached[0] < get_funding_cache_ttl():
+        return cached[1]
+
+    try:
+        async with http.get(
+            BYBIT_TICKERS_URL,
+            params={"category": category, "limit": 1000},
+            timeout=aiohttp.ClientTimeout(total=10),
+        ) as response:
+            response.raise_for_status()
+            payload = await response.json(loads=json_loads)
+    except (TimeoutError, ValueError, aiohttp.ClientError) as exc:
+        print(f"[Bybit] Error fetching tickers: {exc}")
         return []
 
-    return payload.get("result", {}).get("list", [])
+    return _cache_ticker_payload(payload, category)
 
 
 def instrument_exists(symbol: str) -> tuple[bool, str | None]:
@@ -55,27 +124,56 @@ def instrument_exists(symbol: str) -> tuple[bool, str | None]:
                 if cursor:
                     params["cursor"] = cursor
 
-                response = requests.get(BYBIT_INSTRUMENTS_URL, params=params, timeout=10)
+                response = _get_session().get(BYBIT_INSTRUMENTS_URL, params=params, timeout=10)
                 response.raise_for_status()
-                payload = response.json()
+                payload = parse_json(response)
 
                 instruments = payload.get("result", {}).get("list", [])
-                for item in instruments:
-                    if item.get("symbol") == symbol:
-                        return True, category
+                page_symbols = {
+                    item["symbol"] for item in instruments if "symbol" in item
+                }
+                if symbol in page_symbols:
+                    return True, category
 
                 cursor = payload.get("result", {}).get("nextPageCursor", "")
                 if not cursor:
                     break
-        except Exception as exc:
+        except (requests.RequestException, ValueError) as exc:
             print(f"[Bybit] Error checking category '{category}': {exc}")
 
     print(f"[Bybit] Symbol not found: {symbol}")
     return False, None
 
 
+def fetch_instrument_symbols(category: str) -> set[str]:
+    """Page through instruments-info and collect every symbol in a category."""
+    symbols: set[str] = set()
+    cursor = ""
+    try:
+        while True:
+            params = {"category": category, "limit": 1000}
+            if cursor:
+                params["cursor"] = cursor
+
+            response = _get_session().get(BYBIT_INSTRUMENTS_URL, params=params, timeout=10)
+            response.raise_for_status()
+            payload = parse_json(response)
+
+            result = payload.get("result", {})
+            symbols.update(
+                item["symbol"] for item in result.get("list", []) if "symbol" in item
+            )
+
+            cursor = result.get("nextPageCursor", "")
+            if not cursor:
+                break
+    except (requests.RequestException, ValueError) as exc:
+        print(f"[Bybit] Error fetching instruments for category '{category}': {exc}")
+    return symbols
+
+
 def fetch_candles(symbol: str, category: str, interval: str = "D", limit: int = 1000) -> list[Candle] | None:
-    session = HTTP(testnet=False, recv_window=10000)
+    session = _get_kline_session()
     try:
         response = session.get_kline(
             category=category,
@@ -92,29 +190,39 @@ def fetch_candles(symbol: str, category: str, interval: str = "D", limit: int =
         print(f"[Bybit] No candle data returned for {symbol}")
         return None
 
-    candles: list[Candle] = []
+    ordered = raw_candles[::-1]
     current_time_ms = int(time.time() * 1000)
     interval_duration_ms = _interval_duration_ms(interval)
-    for candle in reversed(raw_candles):
-        start_time_ms = int(candle[0])
-        if (
-            interval_duration_ms is not None
-            and start_time_ms + interval_duration_ms > current_time_ms
-        ):
-            continue
 
-        timestamp = start_time_ms / 1000
-        date_format = "%Y-%m-%d" if interval in {"D", "W", "M"} else "%Y-%m-%d %H:%M"
+    start_times_ms = np.array([int(candle[0]) for candle in ordered], dtype=np.int64)
+    if interval_duration_ms is not None:
+        completed = start_times_ms + interval_duration_ms <= current_time_ms
+    else:
+        completed = np.ones(start_times_ms.size, dtype=bool)
+
+    # One vectorized datetime64 conversion replaces a fromtimestamp/strftime
+    # pair per candle; Bybit timestamps are UTC, matching datetime64 semantics.
+    timestamps = start_times_ms // 1000
+    instants = timestamps.astype("datetime64[s]")
+    if interval in {"D", "W", "M"}:
+        dates = instants.astype("datetime64[D]").astype(str)
+    else:
+        dates = np.char.replace(instants.astype("datetime64[m]").astype(str), "T", " ")
+
+    candles: list[Candle] = []
+    for index, candle in enumerate(ordered):
+        if not completed[index]:
+            continue
         candles.append(
             Candle(
-                date=datetime.fromtimestamp(timestamp, tz=UTC).strftime(date_format),
+                date=str(dates[index]),
                 open=float(candle[1]),
                 high=float(candle[2]),
                 low=float(candle[3]),
                 close=float(candle[4]),
                 volume=float(candle[5]),
                 turnover=float(candle[6]),
-                timestamp=int(timestamp),
+                timestamp=int(timestamps[index]),
             )
         )
 
@@ -123,14 +231,14 @@ def fetch_candles(symbol: str, category: str, interval: str = "D", limit: int =
 
 def fetch_symbol_ticker(symbol: str, category: str = "linear") -> dict | None:
     try:
-        response = requests.get(
+        response = _get_session().get(
             BYBIT_TICKERS_URL,
             params={"category": category, "symbol": symbol},
             timeout=10,
         )
         response.raise_for_status()
-        payload = response.json()
-    except Exception as exc:
+        payload = parse_json(response)
+    except (requests.RequestException, ValueError) as exc:
         print(f"[Bybit] Error fetching turnover for {symbol}: {exc}")
         return None
 
@@ -159,14 +267,14 @@ def fetch_orderbook(
     limit: int = 50,
 ) -> OrderBookSnapshot | None:
     try:
-        response = requests.get(
+        response = _get_session().get(
             BYBIT_ORDERBOOK_URL,
             params={"category": category, "symbol": symbol, "limit": limit},
             timeout=8,
         )
         response.raise_for_status()
-        payload = response.json()
-    except Exception as exc:
+        payload = parse_json(response)
+    except (requests.RequestException, ValueError) as exc:
         print(f"[Bybit] Error fetching orderbook for {symbol}: {exc}")
         return None
 
@@ -196,14 +304,14 @@ def fetch_funding_history(
     limit: int = 6,
 ) -> list[FundingRatePoint]:
     try:
-        response = requests.get(
+        response = _get_session().get(
             BYBIT_FUNDING_HISTORY_URL,
             params={"category": "linear", "symbol": symbol, "limit": limit},
             timeout=8,
         )
         response.raise_for_status()
-        payload = response.json()
-    except Exception as exc:
+        payload = parse_json(response)
+    except (requests.RequestException, ValueError) as exc:
         print(f"[Bybit] Error fetching funding history for {symbol}: {exc}")
         return []
 
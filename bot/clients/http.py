@@ -0,0 +1,46 @@
+from __future__ import annotations
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+# orjson decodes the large ticker/kline payloads a few times faster than the
+# stdlib parser; the stdlib stays as a drop-in fallback when it is missing.
+try:
+    from orjson import loads as json_loads
+except ImportError:  # pragma: no cover - exercised only without orjson
+    from json import loads as json_loads
+
+
+def parse_json(response: requests.Response) -> dict:
+    """Decode a JSON response body with the fastest available parser."""
+    return json_loads(response.content)
+
+
+def build_retrying_session(
+    pool_connections: int = 4,
+    pool_maxsize: int = 16,
+) -> requests.Session:
+    """Build a keep-alive session that retries transient GET failures.
+
+    Rate-limit and server errors (429/5xx) back off exponentially and honor
+    Retry-After, so a burst of scans degrades into a short wait instead of
+    silently dropped data.
+    """
+    session = requests.Session()
+    session.headers["Connection"] = "keep-alive"
+    session.mount(
+        "https://",
+        HTTPAdapter(
+            pool_connections=pool_connections,
+            pool_maxsize=pool_maxsize,
+            max_retries=Retry(
+                total=4,
+                backoff_factor=0.5,
+                status_forcelist=[429, 500, 502, 503, 504],
+                allowed_methods=["GET"],
+                respect_retry_after_header=True,
+            ),
+        ),
+    )
+    return session
@@ -1,9 +1,12 @@
 from __future__ import annotations
 
+import threading
 from datetime import UTC, datetime
 
+import aiohttp
 import requests
 
+from bot.clients.http import build_retrying_session, json_loads, parse_json
 from bot.models import (
     FundingRatePoint,
     FundingSnapshot,
@@ -18,6 +21,19 @@ OKX_ORDERBOOK_URL = "https://www.okx.com/api/v5/market/books"
 OKX_FUNDING_HISTORY_URL = "https://www.okx.com/api/v5/public/funding-rate-history"
 OKX_OPEN_INTEREST_URL = "https://www.okx.com/api/v5/public/open-interest"
 
+_SESSION: requests.Session | None = None
+_SESSION_LOCK = threading.Lock()
+
+
+def _get_session() -> requests.Session:
+    """Return the shared pooled session so repeated calls reuse connections."""
+    global _SESSION
+    if _SESSION is None:
+        with _SESSION_LOCK:
+            if _SESSION is None:
+                _SESSION = build_retrying_session()
+    return _SESSION
+
 
 def bybit_to_okx_inst_id(bybit_symbol: str) -> str:
     for quote in ("USDC", "USDT"):
@@ -78,14 +94,14 @@ def _parse_timestamp_ms(timestamp_ms: object) -> datetime | None:
 
 def fetch_usdt_swap_instruments() -> dict[str, OkxInstrument]:
     try:
-        response = requests.get(
+        response = _get_session().get(
             OKX_INSTRUMENTS_URL,
             params={"instType": "SWAP"},
             timeout=8,
         )
         response.raise_for_status()
-        payload = response.json()
-    except Exception as exc:
+        payload = parse_json(response)
+    except (requests.RequestException, ValueError) as exc:
         print(f"[OKX] Error fetching swap instruments: {exc}")
         return {}
 
@@ -113,19 +129,7 @@ def fetch_usdt_swap_instruments() -> dict[str, OkxInstrument]:
     return instruments
 
 
-def fetch_funding_snapshot(inst_id: str) -> FundingSnapshot | None:
-    try:
-        response = requests.get(
-            OKX_FUNDING_URL,
-            params={"instId": inst_id},
-            timeout=8,
-        )
-        response.raise_for_status()
-        payload = response.json()
-    except Exception as exc:
-        print(f"[OKX] Error fetching funding rate for {inst_id}: {exc}")
-        return None
-
+def _snapshot_from_payload(payload: dict) -> FundingSnapshot | None:
     if payload.get("code") != "0" or not payload.get("data"):
         return None
 
@@ -155,24 +159,70 @@ def fetch_funding_snapshot(inst_id: str) -> FundingSnapshot | None:
     )
 
 
+def fetch_funding_snapshot(inst_id: str) -> FundingSnapshot | None:
+    try:
+        response = _get_session().get(
+            OKX_FUNDING_URL,
+            params={"instId": inst_id},
+            timeout=8,
+        )
+        response.raise_for_status()
+        payload = parse_json(response)
+    except (requests.RequestException, ValueError) as exc:
+        print(f"[OKX] Error fetching funding rate for {inst_id}: {exc}")
+        return None
+
+    return _snapshot_from_payload(payload)
+
+
+async def fetch_funding_snapshot_async(
+    http: aiohttp.ClientSession,
+    inst_id: str,
+) -> FundingSnapshot | None:
+    try:
+        async with http.get(
+            OKX_FUNDING_URL,
+            params={"instId": inst_id},
+            timeout=aiohttp.ClientTimeout(total=8),
+        ) as response:
+            response.raise_for_status()
+            payload = await response.json(loads=json_loads)
+    except (TimeoutError, ValueError, aiohttp.ClientError) as exc:
+        print(f"[OKX] Error fetching funding rate for {inst_id}: {exc}")
+        return None
+
+    return _snapshot_from_payload(payload)
+
+
 def fetch_funding_rate(bybit_symbol: str) -> float | None:
     snapshot = fetch_funding_snapshot(bybit_to_okx_inst_id(bybit_symbol))
     return None if snapshot is None else snapshot.rate
 
 
+async def fetch_funding_rate_async(
+    http: aiohttp.ClientSession,
+    bybit_symbol: str,
+) -> float | None:
+    snapshot = await fetch_funding_snapshot_async(
+        http,
+        bybit_to_okx_inst_id(bybit_symbol),
+    )
+    return None if snapshot is None else snapshot.rate
+
+
 def fetch_orderbook(
     instrument: OkxInstrument,
     limit: int = 50,
 ) -> OrderBookSnapshot | None:
     try:
-        response = requests.get(
+        response = _get_session().get(
             OKX_ORDERBOOK_URL,
             params={"instId": instrument.inst_id, "sz": limit},
             timeout=8,
         )
         response.raise_for_status()
-        payload = response.json()
-    except Exception as exc:
+        payload = parse_json(response)
+    except (requests.RequestException, ValueError) as exc:
         print(f"[OKX] Error fetching orderbook for {instrument.inst_id}: {exc}")
         return None
 
@@ -203,14 +253,14 @@ def fetch_funding_history(
     limit: int = 6,
 ) -> list[FundingRatePoint]:
     try:
-        response = requests.get(
+        response = _get_session().get(
             OKX_FUNDING_HISTORY_URL,
             params={"instId": inst_id, "limit": limit},
             timeout=8,
         )
         response.raise_for_status()
-        payload = response.json()
-    except Exception as exc:
+        payload = parse_json(response)
+    except (requests.RequestException, ValueError) as exc:
         print(f"[OKX] Error fetching funding history for {inst_id}: {exc}")
         return []
 
@@ -228,14 +278,14 @@ def fetch_funding_history(
 
 def fetch_open_interest_usdt(inst_id: str) -> float | None:
     try:
-        response = requests.get(
+        response = _get_session().get(
             OKX_OPEN_INTEREST_URL,
             params={"instType": "SWAP", "instId": inst_id},
             timeout=8,
         )
         response.raise_for_status()
-        payload = response.json()
-    except Exception as exc:
+        payload = parse_json(response)
+    except (requests.RequestException, ValueError) as exc:
         print(f"[OKX] Error fetching open interest for {inst_id}: {exc}")
         return None
 
@@ -11,6 +11,9 @@ DEFAULT_OKX_TAKER_FEE_RATE = 0.0005
 DEFAULT_FUNDING_SAFETY_HAIRCUT_RATIO = 0.25
 DEFAULT_FUNDING_HISTORY_SAMPLES = 6
 DEFAULT_FUNDING_PREFILTER_LIMIT = 80
+DEFAULT_FUNDING_CACHE_TTL = 60
+DEFAULT_INSTRUMENT_CACHE_TTL = 3600
+DEFAULT_SCAN_CONCURRENCY = 4
 DEFAULT_ALERT_COOLDOWN = 3600
 DEFAULT_ALERT_MATERIAL_CHANGE = 0.001
 DEFAULT_DISPLAY_TIMEZONE = "Europe/Paris"
@@ -73,6 +76,18 @@ def get_funding_prefilter_limit() -> int:
     return int(os.getenv("FUNDING_PREFILTER_LIMIT", DEFAULT_FUNDING_PREFILTER_LIMIT))
 
 
+def get_funding_cache_ttl() -> float:
+    return float(os.getenv("FUNDING_CACHE_TTL", DEFAULT_FUNDING_CACHE_TTL))
+
+
+def get_instrument_cache_ttl() -> int:
+    return int(os.getenv("INSTRUMENT_CACHE_TTL", DEFAULT_INSTRUMENT_CACHE_TTL))
+
+
+def get_scan_concurrency() -> int:
+    return int(os.getenv("SCAN_CONCURRENCY", DEFAULT_SCAN_CONCURRENCY))
+
+
 def get_default_alert_cooldown() -> int:
     return int(os.getenv("ALERT_COOLDOWN", DEFAULT_ALERT_COOLDOWN))
 
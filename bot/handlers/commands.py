@@ -13,7 +13,12 @@ from bot.reports import (
     format_turnover_reports,
 )
 from bot.services.db import update_chat_settings
-from bot.services.funding import get_top_negative_funding, get_top_positive_funding
+from bot.services.funding import (
+    get_top_negative_funding,
+    get_top_negative_funding_async,
+    get_top_positive_funding,
+    get_top_positive_funding_async,
+)
 from bot.services.funding_diff import get_top_funding_diff
 from bot.services.jobs import (
     get_chat_cooldown,
@@ -21,6 +26,7 @@ from bot.services.jobs import (
     get_chat_threshold,
     get_cooldown_message,
     get_frequency_message,
+    get_http_session,
     get_threshold_message,
     parse_rate_threshold,
     start_scanning_job,
@@ -56,14 +62,22 @@ async def start(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
 
 
 async def _funding_ranking_page(
+    context: ContextTypes.DEFAULT_TYPE,
     *,
     positive: bool,
     page: int,
 ) -> tuple[str, object]:
     offset = page * PAGE_SIZE
-    fetcher = get_top_positive_funding if positive else get_top_negative_funding
-    loop = asyncio.get_running_loop()
-    entries = await loop.run_in_executor(None, fetcher, PAGE_SIZE + 1, offset)
+    http = get_http_session(context)
+    if http is not None:
+        fetcher_async = (
+            get_top_positive_funding_async if positive else get_top_negative_funding_async
+        )
+        entries = await fetcher_async(http, PAGE_SIZE + 1, offset)
+    else:
+        fetcher = get_top_positive_funding if positive else get_top_negative_funding
+        loop = asyncio.get_running_loop()
+        entries = await loop.run_in_executor(None, fetcher, PAGE_SIZE + 1, offset)
     has_next = len(entries) > PAGE_SIZE
     visible_entries = entries[:PAGE_SIZE]
     title = "Positive funding ranking" if positive else "Negative funding ranking"
@@ -77,7 +91,7 @@ async def negative(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
     status_message = await update.effective_message.reply_text(
         "Fetching negative funding rates..."
     )
-    report, keyboard = await _funding_ranking_page(positive=False, page=0)
+    report, keyboard = await _funding_ranking_page(context, positive=False, page=0)
     await status_message.edit_text(
         report,
         parse_mode="HTML",
@@ -90,7 +104,7 @@ async def positive(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
     status_message = await update.effective_message.reply_text(
         "Fetching positive funding rates..."
     )
-    report, keyboard = await _funding_ranking_page(positive=True, page=0)
+    report, keyboard = await _funding_ranking_page(context, positive=True, page=0)
     await status_message.edit_text(
         report,
         parse_mode="HTML",
@@ -162,9 +176,9 @@ async def pagination_callback(
     page = min(MAX_PAGE, int(parts[2]))
 
     if ranking == "negative":
-        report, keyboard = await _funding_ranking_page(positive=False, page=page)
+        report, keyboard = await _funding_ranking_page(context, positive=False, page=page)
     elif ranking == "positive":
-        report, keyboard = await _funding_ranking_page(positive=True, page=page)
+        report, keyboard = await _funding_ranking_page(context, positive=True, page=page)
     elif ranking == "turnover":
         report, keyboard = await _turnover_page(page)
     else:
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import asyncio
+import itertools
 from datetime import datetime
 
 from telegram import Update
@@ -19,12 +20,13 @@ from bot.services.volatility import (
     validate_ticker,
 )
 
-REQUEST_COUNT = 0
+# next() on a count iterator is a single C call, so numbering stays race-free
+# without a lock even if handlers ever run on multiple threads.
+_REQUEST_COUNTER = itertools.count(1)
 
 
 async def handle_message(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
-    global REQUEST_COUNT
-    REQUEST_COUNT += 1
+    request_num = next(_REQUEST_COUNTER)
 
     chat_id = update.effective_chat.id
     start_scanning_job(context, chat_id)
@@ -119,6 +121,6 @@ async def handle_message(update: Update, context: ContextTypes.DEFAULT_TYPE) ->
             print(f"[Messages] Error generating/sending turnover chart for {target_symbol}: {exc}")
 
     print(
-        f"[Messages] Request #{REQUEST_COUNT}: sent report with {len(candles)} candles."
+        f"[Messages] Request #{request_num}: sent report with {len(candles)} candles."
     )
 
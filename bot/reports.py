@@ -11,6 +11,9 @@ from bot.models import (
 )
 
 
+BYBIT_TRADE_URL_BASE = "https://www.bybit.com/trade/usdt/"
+
+
 def _bold(value: object) -> str:
     return f"<b>{escape(str(value))}</b>"
 
@@ -21,7 +24,7 @@ def _code(value: object) -> str:
 
 def _symbol_link(symbol: str) -> str:
     return (
-        f'<a href="https://www.bybit.com/trade/usdt/{quote(symbol, safe="")}">'
+        f'<a href="{BYBIT_TRADE_URL_BASE}{quote(symbol, safe="")}">'
         f"{escape(symbol)}</a>"
     )
 
@@ -134,6 +137,9 @@ def format_funding_diff_report(entries: list[FundingDiffEntry]) -> str:
         "Rates and edges normalized to 8 hours.",
         "",
     ]
+    # Track the rendered length incrementally instead of re-joining the whole
+    # report for every candidate block, which was quadratic in report size.
+    rendered_len = sum(len(line) for line in lines) + len(lines) - 1
     shown = 0
     for index, entry in enumerate(entries, start=1):
         gross_usdt = entry.funding_diff * entry.notional_usdt
@@ -184,10 +190,13 @@ def format_funding_diff_report(entries: list[FundingDiffEntry]) -> str:
             block.append(f"Caution: {escape('; '.join(entry.warnings))}")
         block.append("")
 
-        candidate = "\n".join(lines + block).rstrip()
-        if len(candidate) > 3900:
+        # Joining adds one separator per block line; the trailing blank line
+        # contributes a newline that rstrip() would remove again.
+        block_len = sum(len(line) for line in block) + len(block)
+        if rendered_len + block_len - 1 > 3900:
             break
         lines.extend(block)
+        rendered_len += block_len
         shown += 1
 
     if shown < len(entries):
@@ -200,16 +209,18 @@ def format_extreme_funding_alert(entries: list[FundingEntry]) -> str | None:
         return None
 
     lines = [f"🚨 {_bold('EXTREME FUNDING ALERT')}", ""]
+    rendered_len = sum(len(line) for line in lines) + len(lines) - 1
     for index, entry in enumerate(entries, start=1):
         candidate = (
             f"{index}. {_symbol_link(entry.symbol)}: "
             f"{_code(f'{entry.bybit_rate * 100:.4f}%')} "
             f"{escape(format_okx_bracket(entry.okx_rate))}"
         )
-        if len("\n".join(lines + [candidate])) > 3900:
+        if rendered_len + 1 + len(candidate) > 3900:
             lines.append("Additional alerts omitted for message length.")
             break
         lines.append(candidate)
+        rendered_len += 1 + len(candidate)
     return "\n".join(lines)
 
 
@@ -67,6 +67,13 @@ def init_db(db_path: str | None = None) -> None:
                 CREATE INDEX IF NOT EXISTS idx_alert_state_chat_type
                 ON alert_state (chat_id, alert_type)
             """)
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS instrument_categories (
+                    symbol TEXT PRIMARY KEY,
+                    category TEXT NOT NULL,
+                    updated_at INTEGER NOT NULL
+                )
+            """)
     finally:
         conn.close()
 
@@ -184,6 +191,65 @@ def cleanup_old_records(days: int = 30, db_path: str | None = None) -> None:
         conn.close()
 
 
+def save_symbol_categories(
+    mapping: dict[str, str],
+    *,
+    now: int | None = None,
+    db_path: str | None = None,
+) -> None:
+    """Replace the persisted Bybit symbol-to-category map."""
+    if not mapping:
+        return
+    if now is None:
+        now = int(time.time())
+    init_db(db_path)
+    conn = get_connection(db_path)
+    try:
+        with conn:
+            conn.execute("DELETE FROM instrument_categories")
+            conn.executemany(
+                """
+                INSERT INTO instrument_categories (symbol, category, updated_at)
+                VALUES (?, ?, ?)
+                """,
+                [(symbol, category, now) for symbol, category in mapping.items()],
+            )
+    finally:
+        conn.close()
+
+
+def load_symbol_categories(
+    max_age_seconds: int,
+    *,
+    now: int | None = None,
+    db_path: str | None = None,
+) -> tuple[dict[str, str], int]:
+    """Return the persisted symbol-to-category map and its age in seconds.
+
+    Returns an empty map when nothing was persisted or the snapshot is older
+    than `max_age_seconds`.
+    """
+    if now is None:
+        now = int(time.time())
+    init_db(db_path)
+    conn = get_connection(db_path)
+    try:
+        rows = conn.execute(
+            "SELECT symbol, category, updated_at FROM instrument_categories"
+        ).fetchall()
+    finally:
+        conn.close()
+
+    if not rows:
+        return {}, 0
+
+    saved_at = min(int(row[2]) for row in rows)
+    age = max(0, now - saved_at)
+    if age >= max_age_seconds:
+        return {}, 0
+    return {str(row[0]): str(row[1]) for row in rows}, age
+
+
 def get_chat_settings(
     chat_id: int,
     db_path: str | None = None,
@@ -1,10 +1,59 @@
 from __future__ import annotations
 
-from bot.clients.bybit import fetch_all_tickers
-from bot.clients.okx import fetch_funding_rate
+import asyncio
+
+import aiohttp
+import numpy as np
+
+from bot.clients.bybit import fetch_all_tickers, fetch_all_tickers_async
+from bot.clients.okx import fetch_funding_rate, fetch_funding_rate_async
 from bot.models import FundingEntry
 
 
+def _extract_symbols_rates(tickers: list[dict]) -> tuple[np.ndarray, np.ndarray]:
+    """Convert raw tickers into parallel USDT symbol/rate arrays in one pass.
+
+    Missing funding rates (absent key, None, or empty string) become NaN so
+    callers can filter them with a plain finite mask instead of per-item
+    exception handling.
+    """
+    usdt_tickers = [
+        ticker for ticker in tickers if ticker.get("symbol", "").endswith("USDT")
+    ]
+    count = len(usdt_tickers)
+    symbols = np.fromiter(
+        (ticker["symbol"] for ticker in usdt_tickers),
+        dtype=object,
+        count=count,
+    )
+    rates = np.fromiter(
+        (float(ticker.get("fundingRate") or "nan") for ticker in usdt_tickers),
+        dtype=np.float64,
+        count=count,
+    )
+    return symbols, rates
+
+
+def _ranked_pairs(
+    symbols: np.ndarray,
+    rates: np.ndarray,
+    *,
+    descending: bool,
+    keep: int | None = None,
+) -> list[tuple[str, float]]:
+    keys = -rates if descending else rates
+    if keep is not None and 0 < keep < keys.size:
+        # O(n) selection of the requested head before sorting only that slice.
+        head = np.argpartition(keys, keep - 1)[:keep]
+        order = head[np.argsort(keys[head], kind="stable")]
+    else:
+        order = np.argsort(keys, kind="stable")
+    return [
+        (str(symbol), float(rate))
+        for symbol, rate in zip(symbols[order], rates[order])
+    ]
+
+
 def rank_funding_entries(
     tickers: list[dict],
     *,
@@ -12,44 +61,54 @@ def rank_funding_entries(
     limit: int = 10,
     offset: int = 0,
 ) -> list[tuple[str, float]]:
-    ranked: list[tuple[str, float]] = []
-    for ticker in tickers:
-        symbol = ticker.get("symbol", "")
-        if not symbol.endswith("USDT"):
-            continue
-
-        funding_rate = ticker.get("fundingRate")
-        if not funding_rate:
-            continue
-
-        try:
-            parsed_rate = float(funding_rate)
-        except ValueError:
-            continue
-
-        if positive and parsed_rate > 0:
-            ranked.append((symbol, parsed_rate))
-        if not positive and parsed_rate < 0:
-            ranked.append((symbol, parsed_rate))
-
-    ranked.sort(key=lambda item: item[1], reverse=positive)
+    symbols, rates = _extract_symbols_rates(tickers)
+    mask = np.isfinite(rates) & ((rates > 0) if positive else (rates < 0))
+    ranked = _ranked_pairs(
+        symbols[mask],
+        rates[mask],
+        descending=positive,
+        keep=offset + limit,
+    )
     return ranked[offset : offset + limit]
 
 
+def rank_extreme_funding(
+    tickers: list[dict],
+    threshold: float,
+) -> list[tuple[str, float]]:
+    symbols, rates = _extract_symbols_rates(tickers)
+    mask = np.isfinite(rates) & (rates <= threshold)
+    return _ranked_pairs(symbols[mask], rates[mask], descending=False)
+
+
+def _build_entries(ranked: list[tuple[str, float]]) -> list[FundingEntry]:
+    return [
+        FundingEntry(symbol=symbol, bybit_rate=rate, okx_rate=fetch_funding_rate(symbol))
+        for symbol, rate in ranked
+    ]
+
+
+async def _build_entries_async(
+    http: aiohttp.ClientSession,
+    ranked: list[tuple[str, float]],
+) -> list[FundingEntry]:
+    okx_rates = await asyncio.gather(
+        *(fetch_funding_rate_async(http, symbol) for symbol, _ in ranked)
+    )
+    return [
+        FundingEntry(symbol=symbol, bybit_rate=rate, okx_rate=okx_rate)
+        for (symbol, rate), okx_rate in zip(ranked, okx_rates)
+    ]
+
+
 def get_top_negative_funding(
     limit: int = 10,
     offset: int = 0,
 ) -> list[FundingEntry]:
     tickers = fetch_all_tickers()
-    return [
-        FundingEntry(symbol=symbol, bybit_rate=rate, okx_rate=fetch_funding_rate(symbol))
-        for symbol, rate in rank_funding_entries(
-            tickers,
-            positive=False,
-            limit=limit,
-            offset=offset,
-        )
-    ]
+    return _build_entries(
+        rank_funding_entries(tickers, positive=False, limit=limit, offset=offset)
+    )
 
 
 def get_top_positive_funding(
@@ -57,39 +116,43 @@ def get_top_positive_funding(
     offset: int = 0,
 ) -> list[FundingEntry]:
     tickers = fetch_all_tickers()
-    return [
-        FundingEntry(symbol=symbol, bybit_rate=rate, okx_rate=fetch_funding_rate(symbol))
-        for symbol, rate in rank_funding_entries(
-            tickers,
-            positive=True,
-            limit=limit,
-            offset=offset,
-        )
-    ]
+    return _build_entries(
+        rank_funding_entries(tickers, positive=True, limit=limit, offset=offset)
+    )
 
 
-def find_extreme_funding(threshold: float = -0.015) -> list[FundingEntry]:
-    tickers = fetch_all_tickers()
-    ranked: list[tuple[str, float]] = []
-    for ticker in tickers:
-        symbol = ticker.get("symbol", "")
-        if not symbol.endswith("USDT"):
-            continue
+async def get_top_negative_funding_async(
+    http: aiohttp.ClientSession,
+    limit: int = 10,
+    offset: int = 0,
+) -> list[FundingEntry]:
+    tickers = await fetch_all_tickers_async(http)
+    return await _build_entries_async(
+        http,
+        rank_funding_entries(tickers, positive=False, limit=limit, offset=offset),
+    )
 
-        funding_rate = ticker.get("fundingRate")
-        if not funding_rate:
-            continue
 
-        try:
-            parsed_rate = float(funding_rate)
-        except ValueError:
-            continue
+async def get_top_positive_funding_async(
+    http: aiohttp.ClientSession,
+    limit: int = 10,
+    offset: int = 0,
+) -> list[FundingEntry]:
+    tickers = await fetch_all_tickers_async(http)
+    return await _build_entries_async(
+        http,
+        rank_funding_entries(tickers, positive=True, limit=limit, offset=offset),
+    )
 
-        if parsed_rate <= threshold:
-            ranked.append((symbol, parsed_rate))
 
-    ranked.sort(key=lambda item: item[1])
-    return [
-        FundingEntry(symbol=symbol, bybit_rate=rate, okx_rate=fetch_funding_rate(symbol))
-        for symbol, rate in ranked
-    ]
+def find_extreme_funding(threshold: float = -0.015) -> list[FundingEntry]:
+    tickers = fetch_all_tickers()
+    return _build_entries(rank_extreme_funding(tickers, threshold))
+
+
+async def find_extreme_funding_async(
+    http: aiohttp.ClientSession,
+    threshold: float = -0.015,
+) -> list[FundingEntry]:
+    tickers = await fetch_all_tickers_async(http)
+    return await _build_entries_async(http, rank_extreme_funding(tickers, threshold))
@@ -0,0 +1,90 @@
+from __future__ import annotations
+
+import threading
+import time
+
+from bot.clients.bybit import fetch_instrument_symbols, instrument_exists
+from bot.config import get_instrument_cache_ttl
+from bot.services.db import load_symbol_categories, save_symbol_categories
+
+
+INSTRUMENT_CATEGORIES = ("linear", "inverse", "spot")
+
+_SYMBOL_CATEGORIES: dict[str, str] = {}
+_REFRESHED_AT: float | None = None
+_REFRESH_LOCK = threading.Lock()
+_PERSISTED_CACHE_CHECKED = False
+
+
+def refresh_symbol_categories() -> int:
+    """Rebuild the symbol-to-category map from Bybit's instrument universe.
+
+    Returns the number of cached instruments, or 0 when nothing could be
+    fetched, in which case any previous cache is kept.
+    """
+    global _REFRESHED_AT
+
+    mapping: dict[str, str] = {}
+    # setdefault keeps the first category that lists a symbol, matching the
+    # (linear, inverse, spot) resolution order of the paging slow path.
+    for category in INSTRUMENT_CATEGORIES:
+        for symbol in fetch_instrument_symbols(category):
+            mapping.setdefault(symbol, category)
+
+    if not mapping:
+        return 0
+
+    with _REFRESH_LOCK:
+        _SYMBOL_CATEGORIES.clear()
+        _SYMBOL_CATEGORIES.update(mapping)
+        _REFRESHED_AT = time.monotonic()
+    save_symbol_categories(mapping)
+    return len(mapping)
+
+
+def _load_persisted_cache() -> None:
+    """Seed the in-memory map from SQLite once, so a restart skips paging.
+
+    The persisted snapshot keeps its original age: a map saved an hour ago is
+    treated as refreshed an hour ago, not as brand new.
+    """
+    global _PERSISTED_CACHE_CHECKED, _REFRESHED_AT
+
+    with _REFRESH_LOCK:
+        if _PERSISTED_CACHE_CHECKED or _REFRESHED_AT is not None:
+            _PERSISTED_CACHE_CHECKED = True
+            return
+        _PERSISTED_CACHE_CHECKED = True
+
+    mapping, age = load_symbol_categories(get_instrument_cache_ttl())
+    if not mapping:
+        return
+
+    with _REFRESH_LOCK:
+        if _REFRESHED_AT is None:
+            _SYMBOL_CATEGORIES.update(mapping)
+            _REFRESHED_AT = time.monotonic() - age
+            print(f"[Instruments] Restored {len(mapping)} symbol categories from disk.")
+
+
+def _cache_is_fresh() -> bool:
+    return (
+        _REFRESHED_AT is not None
+        and time.monotonic() - _REFRESHED_AT < get_instrument_cache_ttl()
+    )
+
+
+def resolve_symbol_category(symbol: str) -> tuple[bool, str | None]:
+    """Resolve a symbol's category, preferring the cached instrument map.
+
+    A fresh cache answers in one dict lookup. Unknown symbols still fall
+    through to paging Bybit directly, so listings newer than the last refresh
+    remain resolvable.
+    """
+    _load_persisted_cache()
+    if _cache_is_fresh():
+        category = _SYMBOL_CATEGORIES.get(symbol)
+        if category is not None:
+            return True, category
+
+    return instrument_exists(symbol)
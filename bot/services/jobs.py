@@ -7,7 +7,11 @@ import time
 from telegram import LinkPreviewOptions
 from telegram.ext import ContextTypes
 
-from bot.config import get_alert_material_change
+from bot.config import (
+    get_alert_material_change,
+    get_instrument_cache_ttl,
+    get_scan_concurrency,
+)
 from bot.reports import (
     format_extreme_funding_alert,
     format_funding_diff_report,
@@ -23,14 +27,37 @@ from bot.services.db import (
     select_alert_changes,
     update_chat_settings,
 )
-from bot.services.funding import find_extreme_funding
+from bot.services.funding import find_extreme_funding, find_extreme_funding_async
 from bot.services.funding_diff import get_top_funding_diff
+from bot.services.instruments import refresh_symbol_categories
 
 
 FUNDING_DIFF_REPORT_LIMIT = 5
 FUNDING_DIFF_REPORT_THRESHOLD = 0.003
 
 
+def get_http_session(context: ContextTypes.DEFAULT_TYPE):
+    """Return the application-wide aiohttp session, or None outside the app."""
+    application = getattr(context, "application", None)
+    bot_data = getattr(application, "bot_data", None)
+    return bot_data.get("http") if bot_data else None
+
+
+def get_scan_semaphore(context: ContextTypes.DEFAULT_TYPE) -> asyncio.Semaphore:
+    """Return the application-wide scan semaphore.
+
+    Per-chat scan jobs can align and fire together; the shared semaphore caps
+    how many of them touch the exchanges at once. Outside the application a
+    fresh semaphore is returned, which imposes no cross-call limit.
+    """
+    application = getattr(context, "application", None)
+    bot_data = getattr(application, "bot_data", None)
+    semaphore = bot_data.get("scan_sem") if bot_data else None
+    if semaphore is None:
+        semaphore = asyncio.Semaphore(get_scan_concurrency())
+    return semaphore
+
+
 def get_chat_threshold(context: ContextTypes.DEFAULT_TYPE, chat_id: int) -> float:
     return get_chat_settings(chat_id).funding_threshold
 
@@ -71,10 +98,16 @@ async def scan_funding_job(context: ContextTypes.DEFAULT_TYPE) -> None:
         return
 
     threshold = settings.funding_threshold
-    extreme_entries, diff_entries = await asyncio.gather(
-        loop.run_in_executor(None, find_extreme_funding, threshold),
-        loop.run_in_executor(None, get_top_funding_diff, FUNDING_DIFF_REPORT_LIMIT),
-    )
+    http = get_http_session(context)
+    async with get_scan_semaphore(context):
+        extreme_entries, diff_entries = await asyncio.gather(
+            # The arbitrage screen stays on the executor: it fans out through
+            # the blocking pybit/requests stack for orderbooks and history.
+            find_extreme_funding_async(http, threshold)
+            if http is not None
+            else loop.run_in_executor(None, find_extreme_funding, threshold),
+            loop.run_in_executor(None, get_top_funding_diff, FUNDING_DIFF_REPORT_LIMIT),
+        )
     material_change = get_alert_material_change()
     extreme_symbols = select_alert_changes(
         job.chat_id,
@@ -239,6 +272,18 @@ async def record_hourly_turnover_job(context: ContextTypes.DEFAULT_TYPE) -> None
         print(f"[Jobs] Error in record_hourly_turnover_job: {exc}")
 
 
+async def refresh_symbol_categories_job(context: ContextTypes.DEFAULT_TYPE) -> None:
+    loop = asyncio.get_running_loop()
+    try:
+        cached_count = await loop.run_in_executor(None, refresh_symbol_categories)
+        if cached_count:
+            print(f"[Jobs] Symbol-category cache refreshed with {cached_count} instruments.")
+        else:
+            print("[Jobs] Warning: symbol-category refresh returned nothing; keeping previous cache.")
+    except Exception as exc:
+        print(f"[Jobs] Error in refresh_symbol_categories_job: {exc}")
+
+
 def seconds_until_next_hour(timestamp: float | None = None) -> float:
     """Return the delay until the next UTC clock-hour boundary."""
     current_time = time.time() if timestamp is None else timestamp
@@ -272,3 +317,14 @@ def start_global_jobs(application) -> None:
         print(
             "[Jobs] Registered startup turnover snapshot and clock-hour recording job."
         )
+
+    if not application.job_queue.get_jobs_by_name("refresh_symbol_categories"):
+        # Warm the cache shortly after startup, then keep it one TTL fresh so
+        # ticker validation stays a dict lookup instead of paging Bybit.
+        application.job_queue.run_repeating(
+            refresh_symbol_categories_job,
+            interval=get_instrument_cache_ttl(),
+            first=5,
+            name="refresh_symbol_categories",
+        )
+        print("[Jobs] Registered symbol-category cache refresh job.")
@@ -1,13 +1,19 @@
 from __future__ import annotations
 
 import math
-import statistics
+from concurrent.futures import ThreadPoolExecutor, as_completed
 
-from bot.clients.bybit import fetch_all_tickers, fetch_candles, instrument_exists
+import numpy as np
+
+from bot.clients.bybit import fetch_all_tickers, fetch_candles
 from bot.models import Candle, VolatilityStats
+from bot.services.instruments import resolve_symbol_category
 
 
 LIQUIDITY_REFERENCE_TURNOVER_USDT = 10_000_000.0
+PUMP_PERCENTILE_LEVELS = (0.75, 0.80, 0.85, 0.90, 0.95, 0.99)
+# Bounded fan-out keeps the scan inside Bybit's kline rate limits.
+SCAN_FETCH_WORKERS = 8
 
 
 def normalize_symbol(user_text: str) -> str:
@@ -18,7 +24,7 @@ def normalize_symbol(user_text: str) -> str:
 
 
 def validate_ticker(symbol: str) -> tuple[bool, str | None]:
-    return instrument_exists(symbol)
+    return resolve_symbol_category(symbol)
 
 
 def fetch_market_data(symbol: str, category: str, interval: str = "D", limit: int = 1000) -> list[Candle] | None:
@@ -29,124 +35,120 @@ def analyze_market_data(candles: list[Candle]) -> VolatilityStats | None:
     if not candles or len(candles) < 30:
         return None
 
-    pump_data: list[tuple[float, str]] = []
-    dump_data: list[tuple[float, str]] = []
-    log_returns: list[float] = []
-    true_ranges: list[float] = []
-
-    for index, candle in enumerate(candles):
-        if candle.open > 0:
-            pump_data.append(((candle.high - candle.open) / candle.open, candle.date))
-            dump_data.append(((candle.low - candle.open) / candle.open, candle.date))
-
-        if index == 0:
-            continue
-
-        previous_close = candles[index - 1].close
-        if previous_close > 0 and candle.close > 0:
-            log_returns.append(math.log(candle.close / previous_close))
-
-        true_ranges.append(
-            max(
-                candle.high - candle.low,
-                abs(candle.high - previous_close),
-                abs(candle.low - previous_close),
-            )
-        )
+    count = len(candles)
+    # One pass over the candle objects: build a packed (6, n) float64 block and
+    # hand each metric a contiguous column view instead of re-walking the list.
+    columns = np.ascontiguousarray(
+        np.array(
+            [
+                (c.open, c.high, c.low, c.close, c.volume, c.turnover)
+                for c in candles
+            ],
+            dtype=np.float64,
+        ).T
+    )
+    opens, highs, lows, closes, volumes, turnovers = columns
+
+    open_mask = opens > 0
+    pump_values = (highs[open_mask] - opens[open_mask]) / opens[open_mask]
+    dump_values = (lows[open_mask] - opens[open_mask]) / opens[open_mask]
+    extreme_dates = [c.date for c, valid in zip(candles, open_mask) if valid]
+
+    previous_closes = closes[:-1]
+    current_closes = closes[1:]
+    returns_mask = (previous_closes > 0) & (current_closes > 0)
+    log_returns = np.log(current_closes[returns_mask] / previous_closes[returns_mask])
+    true_ranges = np.maximum.reduce(
+        [
+            highs[1:] - lows[1:],
+            np.abs(highs[1:] - previous_closes),
+            np.abs(lows[1:] - previous_closes),
+        ]
+    )
 
-    if len(log_returns) > 1:
-        stdev_log = statistics.stdev(log_returns)
+    if log_returns.size > 1:
+        stdev_log = float(log_returns.std(ddof=1))
         vol_day = stdev_log
         vol_week = stdev_log * (7**0.5)
     else:
         vol_day = 0.0
         vol_week = 0.0
 
-    max_log = max(log_returns) if log_returns else 0.0
-    min_log = min(log_returns) if log_returns else 0.0
-
-    if pump_data:
-        max_pump_val, max_pump_date = max(pump_data, key=lambda item: item[0])
-        pump_values = [value for value, _ in pump_data]
-        avg_pump = statistics.mean(pump_values)
-        std_pump = statistics.stdev(pump_values) if len(pump_values) > 1 else 0.0
-        sorted_pumps = sorted(pump_values)
+    max_log = float(log_returns.max()) if log_returns.size else 0.0
+    min_log = float(log_returns.min()) if log_returns.size else 0.0
+
+    if pump_values.size:
+        max_pump_index = int(pump_values.argmax())
+        max_pump_val = float(pump_values[max_pump_index])
+        max_pump_date = extreme_dates[max_pump_index]
+        avg_pump = float(pump_values.mean())
+        std_pump = float(pump_values.std(ddof=1)) if pump_values.size > 1 else 0.0
+        # Partitioning places each percentile index in sorted position without
+        # paying for a full sort of the pump distribution.
+        percentile_indices = sorted(
+            {int(pump_values.size * level) for level in PUMP_PERCENTILE_LEVELS}
+        )
+        partitioned_pumps = np.partition(pump_values, percentile_indices)
     else:
         max_pump_val, max_pump_date = 0.0, "N/A"
         avg_pump = 0.0
         std_pump = 0.0
-        sorted_pumps = []
-
-    if dump_data:
-        max_dump_val, max_dump_date = min(dump_data, key=lambda item: item[0])
-        dump_values = [value for value, _ in dump_data]
-        avg_dump = statistics.mean(dump_values)
-        std_dump = statistics.stdev(dump_values) if len(dump_values) > 1 else 0.0
+        partitioned_pumps = pump_values
+
+    if dump_values.size:
+        max_dump_index = int(dump_values.argmin())
+        max_dump_val = float(dump_values[max_dump_index])
+        max_dump_date = extreme_dates[max_dump_index]
+        avg_dump = float(dump_values.mean())
+        std_dump = float(dump_values.std(ddof=1)) if dump_values.size > 1 else 0.0
     else:
         max_dump_val, max_dump_date = 0.0, "N/A"
         avg_dump = 0.0
         std_dump = 0.0
 
     current_close = candles[-1].close
-    atr_14 = statistics.mean(true_ranges[-14:]) if len(true_ranges) >= 14 else 0.0
-    atr_28 = statistics.mean(true_ranges[-28:]) if len(true_ranges) >= 28 else 0.0
+    # Both ATR windows read from the same 28-value tail slice.
+    tr_tail = true_ranges[-28:]
+    atr_14 = float(tr_tail[-14:].mean()) if true_ranges.size >= 14 else 0.0
+    atr_28 = float(tr_tail.mean()) if true_ranges.size >= 28 else 0.0
     atr_relative = atr_28 / current_close if current_close > 0 and atr_28 else 0.0
 
     def get_percentile(percent: float) -> float:
-        if not sorted_pumps:
+        if not partitioned_pumps.size:
             return 0.0
-        return sorted_pumps[int(len(sorted_pumps) * percent)]
+        return float(partitioned_pumps[int(partitioned_pumps.size * percent)])
 
-    avg_price_10 = (
-        statistics.mean(c.open for c in candles[-10:])
-        if len(candles) >= 10
-        else None
-    )
-    avg_price_30 = (
-        statistics.mean(c.open for c in candles[-30:])
-        if len(candles) >= 30
-        else None
-    )
-    avg_price_60 = (
-        statistics.mean(c.open for c in candles[-60:])
-        if len(candles) >= 60
-        else None
-    )
-    avg_price_90 = (
-        statistics.mean(c.open for c in candles[-90:])
-        if len(candles) >= 90
-        else None
-    )
+    avg_price_10 = float(opens[-10:].mean()) if count >= 10 else None
+    avg_price_30 = float(opens[-30:].mean()) if count >= 30 else None
+    avg_price_60 = float(opens[-60:].mean()) if count >= 60 else None
+    avg_price_90 = float(opens[-90:].mean()) if count >= 90 else None
 
-    negative_returns = [min(value, 0.0) for value in log_returns]
     downside_deviation = (
-        math.sqrt(statistics.mean(value * value for value in negative_returns))
-        if negative_returns
+        float(np.sqrt(np.mean(np.minimum(log_returns, 0.0) ** 2)))
+        if log_returns.size
         else 0.0
     )
 
-    peak_close = 0.0
-    max_drawdown = 0.0
-    for candle in candles:
-        if candle.close <= 0:
-            continue
-        peak_close = max(peak_close, candle.close)
-        if peak_close > 0:
-            max_drawdown = min(max_drawdown, candle.close / peak_close - 1)
-
-    recent_30 = candles[-30:]
-    sma_30 = statistics.mean(c.close for c in recent_30) if recent_30 else None
-    total_volume_30 = sum(c.volume for c in recent_30 if c.volume > 0)
-    total_turnover_30 = sum(c.turnover for c in recent_30 if c.turnover > 0)
+    valid_closes = closes[closes > 0]
+    if valid_closes.size:
+        running_peaks = np.maximum.accumulate(valid_closes)
+        max_drawdown = min(0.0, float((valid_closes / running_peaks - 1.0).min()))
+    else:
+        max_drawdown = 0.0
+
+    recent_closes = closes[-30:]
+    recent_volumes = volumes[-30:]
+    recent_turnovers = turnovers[-30:]
+    sma_30 = float(recent_closes.mean()) if recent_closes.size else None
+    total_volume_30 = float(recent_volumes[recent_volumes > 0].sum())
+    total_turnover_30 = float(recent_turnovers[recent_turnovers > 0].sum())
     vwap_30 = (
         total_turnover_30 / total_volume_30
         if total_volume_30 > 0 and total_turnover_30 > 0
         else None
     )
     avg_turnover_30 = (
-        statistics.mean(c.turnover for c in recent_30)
-        if recent_30
-        else None
+        float(recent_turnovers.mean()) if recent_turnovers.size else None
     )
     distance_to_sma_30 = (
         current_close / sma_30 - 1
@@ -239,20 +241,32 @@ def scan_market_volatility(top_n: int = 50) -> list[tuple[str, float]]:
 
     results: list[tuple[str, float]] = []
     skipped_coins: list[str] = []
-    
-    for symbol, _ in top_tickers:
-        candles = fetch_candles(symbol, "linear", "D", limit=50)
-        if not candles:
-            skipped_coins.append(symbol)
-            continue
-
-        stats = analyze_market_data(candles)
-        if not stats:
-            skipped_coins.append(symbol)
-            continue
 
-        if stats.atr_relative > 0:
-            results.append((symbol, stats.atr_relative))
+    max_workers = min(SCAN_FETCH_WORKERS, len(top_tickers)) or 1
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        future_to_symbol = {
+            executor.submit(fetch_candles, symbol, "linear", "D", 50): symbol
+            for symbol, _ in top_tickers
+        }
+        for future in as_completed(future_to_symbol):
+            symbol = future_to_symbol[future]
+            try:
+                candles = future.result()
+            except Exception as exc:
+                print(f"[Volatility] Error fetching candles for {symbol}: {exc}")
+                skipped_coins.append(symbol)
+                continue
+            if not candles:
+                skipped_coins.append(symbol)
+                continue
+
+            stats = analyze_market_data(candles)
+            if not stats:
+                skipped_coins.append(symbol)
+                continue
+
+            if stats.atr_relative > 0:
+                results.append((symbol, stats.atr_relative))
 
     if skipped_coins:
         print(f"[Volatility] Not enough data to compute statistics. Coins skipped: {', '.join(skipped_coins)}")
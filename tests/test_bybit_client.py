@@ -1,11 +1,51 @@
+import json
 import unittest
-from unittest.mock import patch
+from unittest.mock import MagicMock, patch
 
-from bot.clients.bybit import fetch_candles
+from bot.clients.bybit import _TICKER_CACHE, fetch_all_tickers, fetch_candles
+
+
+def mock_session(payload: dict) -> MagicMock:
+    response = MagicMock()
+    response.content = json.dumps(payload).encode()
+    session = MagicMock()
+    session.get.return_value = response
+    return session
+
+
+class BybitTickerCacheTests(unittest.TestCase):
+    def setUp(self) -> None:
+        _TICKER_CACHE.clear()
+
+    def tearDown(self) -> None:
+        _TICKER_CACHE.clear()
+
+    def test_snapshot_is_reused_within_ttl(self) -> None:
+        session = mock_session(
+            {"retCode": 0, "result": {"list": [{"symbol": "BTCUSDT"}]}}
+        )
+
+        with patch("bot.clients.bybit._get_session", return_value=session):
+            first = fetch_all_tickers()
+            second = fetch_all_tickers()
+
+        self.assertEqual(first, [{"symbol": "BTCUSDT"}])
+        self.assertEqual(second, first)
+        session.get.assert_called_once()
+
+    def test_api_errors_are_not_cached(self) -> None:
+        session = mock_session({"retCode": 10001, "retMsg": "rate limited"})
+
+        with patch("bot.clients.bybit._get_session", return_value=session):
+            self.assertEqual(fetch_all_tickers(), [])
+            self.assertEqual(fetch_all_tickers(), [])
+
+        self.assertEqual(session.get.call_count, 2)
 
 
 class BybitCandleTests(unittest.TestCase):
     @patch("bot.clients.bybit.time.time", return_value=1767355200.0)
+    @patch("bot.clients.bybit._KLINE_SESSION", None)
     @patch("bot.clients.bybit.HTTP")
     def test_fetch_candles_excludes_active_daily_candle(
         self,
@@ -29,6 +69,7 @@ class BybitCandleTests(unittest.TestCase):
         self.assertEqual([item.date for item in candles], ["2026-01-01"])
 
     @patch("bot.clients.bybit.time.time", return_value=1767357000.0)
+    @patch("bot.clients.bybit._KLINE_SESSION", None)
     @patch("bot.clients.bybit.HTTP")
     def test_fetch_candles_excludes_active_hourly_candle(
         self,
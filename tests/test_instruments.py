@@ -0,0 +1,78 @@
+import unittest
+from unittest.mock import patch
+
+import bot.services.instruments as instruments
+from bot.services.instruments import refresh_symbol_categories, resolve_symbol_category
+
+
+class SymbolCategoryCacheTests(unittest.TestCase):
+    def setUp(self) -> None:
+        instruments._SYMBOL_CATEGORIES.clear()
+        instruments._REFRESHED_AT = None
+        instruments._PERSISTED_CACHE_CHECKED = True
+        for target in ("save_symbol_categories", "load_symbol_categories"):
+            patcher = patch(f"bot.services.instruments.{target}")
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    def tearDown(self) -> None:
+        instruments._SYMBOL_CATEGORIES.clear()
+        instruments._REFRESHED_AT = None
+        instruments._PERSISTED_CACHE_CHECKED = False
+
+    def test_fresh_cache_resolves_without_paging(self) -> None:
+        universe = {
+            "linear": {"BTCUSDT", "SHAREDUSDT"},
+            "inverse": {"BTCUSD"},
+            "spot": {"SHAREDUSDT", "PEPEUSDT"},
+        }
+        with patch(
+            "bot.services.instruments.fetch_instrument_symbols",
+            side_effect=lambda category: universe[category],
+        ):
+            cached_count = refresh_symbol_categories()
+
+        with patch("bot.services.instruments.instrument_exists") as slow_path:
+            self.assertEqual(resolve_symbol_category("BTCUSDT"), (True, "linear"))
+            self.assertEqual(resolve_symbol_category("PEPEUSDT"), (True, "spot"))
+            # The first category listing a symbol wins, as in the slow path.
+            self.assertEqual(resolve_symbol_category("SHAREDUSDT"), (True, "linear"))
+
+        self.assertEqual(cached_count, 4)
+        slow_path.assert_not_called()
+
+    def test_unknown_symbol_falls_back_to_paging(self) -> None:
+        with patch(
+            "bot.services.instruments.fetch_instrument_symbols",
+            return_value={"BTCUSDT"},
+        ):
+            refresh_symbol_categories()
+
+        with patch(
+            "bot.services.instruments.instrument_exists",
+            return_value=(False, None),
+        ) as slow_path:
+            self.assertEqual(resolve_symbol_category("NEWUSDT"), (False, None))
+
+        slow_path.assert_called_once_with("NEWUSDT")
+
+    def test_empty_refresh_keeps_previous_cache(self) -> None:
+        with patch(
+            "bot.services.instruments.fetch_instrument_symbols",
+            return_value={"BTCUSDT"},
+        ):
+            refresh_symbol_categories()
+        with patch(
+            "bot.services.instruments.fetch_instrument_symbols",
+            return_value=set(),
+        ):
+            self.assertEqual(refresh_symbol_categories(), 0)
+
+        with patch("bot.services.instruments.instrument_exists") as slow_path:
+            self.assertEqual(resolve_symbol_category("BTCUSDT"), (True, "linear"))
+
+        slow_path.assert_not_called()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -183,9 +183,13 @@ class GlobalTurnoverJobTests(unittest.TestCase):
             job_queue.run_once.call_args.kwargs["name"],
             "record_hourly_turnover_startup",
         )
-        job_queue.run_repeating.assert_called_once()
-        self.assertEqual(job_queue.run_repeating.call_args.kwargs["interval"], 3600)
-        self.assertEqual(job_queue.run_repeating.call_args.kwargs["first"], 1234)
+        repeating = {
+            call.kwargs["name"]: call.kwargs
+            for call in job_queue.run_repeating.call_args_list
+        }
+        self.assertEqual(repeating["record_hourly_turnover"]["interval"], 3600)
+        self.assertEqual(repeating["record_hourly_turnover"]["first"], 1234)
+        self.assertIn("refresh_symbol_categories", repeating)
 
 if __name__ == "__main__":
     unittest.main()
@@ -8,7 +8,9 @@ from bot.services.db import (
     get_chat_settings,
     init_db,
     list_subscribed_chat_settings,
+    load_symbol_categories,
     record_alert_notifications,
+    save_symbol_categories,
     select_alert_changes,
     update_chat_settings,
 )
@@ -176,6 +178,23 @@ class ChatSettingsPersistenceTests(unittest.TestCase):
         )
         self.assertEqual(reentry, {"BTCUSDT"})
 
+    def test_symbol_categories_roundtrip_and_expire(self) -> None:
+        mapping = {"BTCUSDT": "linear", "PEPEUSDT": "spot"}
+        save_symbol_categories(mapping, now=1_000, db_path=self.db_path)
+
+        loaded, age = load_symbol_categories(
+            3_600, now=1_500, db_path=self.db_path
+        )
+        self.assertEqual(loaded, mapping)
+        self.assertEqual(age, 500)
+
+        stale, _ = load_symbol_categories(3_600, now=5_000, db_path=self.db_path)
+        self.assertEqual(stale, {})
+
+        save_symbol_categories({"ETHUSDT": "linear"}, now=6_000, db_path=self.db_path)
+        replaced, _ = load_symbol_categories(3_600, now=6_100, db_path=self.db_path)
+        self.assertEqual(replaced, {"ETHUSDT": "linear"})
+
     def test_missing_limited_rank_entry_is_not_treated_as_threshold_exit(self) -> None:
         record_alert_notifications(
             123,